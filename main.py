@@ -1,17 +1,50 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
+import secrets
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from decimal import Decimal
+from functools import wraps
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from fastapi import Depends, FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+import redis.asyncio as redis
+from pydantic import BaseModel, Field, TypeAdapter
 from dotenv import load_dotenv
-from sqlalchemy import DECIMAL, ForeignKey, Integer, String, create_engine, select, text
-from sqlalchemy.engine import make_url
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, sessionmaker
+from sqlalchemy import (
+    DECIMAL,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    cast,
+    create_engine,
+    delete,
+    func,
+    insert,
+    Select,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.engine import URL, RowMapping, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    InstrumentedAttribute,
+    Mapped,
+    mapped_column,
+    raiseload,
+    relationship,
+    selectinload,
+)
+from sqlalchemy.pool import StaticPool
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -20,6 +53,13 @@ PRODUCTS_FILE = DATA_DIR / "products.json"
 ORDERS_FILE = DATA_DIR / "orders.json"
 load_dotenv(BASE_DIR / ".env")
 DATABASE_URL = os.getenv("DATABASE_URL", "mysql+pymysql://root:@127.0.0.1:3306/product_order_db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_CONTROL = "max-age=30, stale-while-revalidate=60"
 
 
 class Base(DeclarativeBase):
@@ -38,13 +78,16 @@ class ProductModel(Base):
 
 class OrderModel(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_status_customer", "status", "customer_name"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     customer_name: Mapped[str] = mapped_column(String(120), nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     total_amount: Mapped[Decimal] = mapped_column(DECIMAL(12, 2), nullable=False, default=0)
     items: Mapped[list[OrderItemModel]] = relationship(
-        back_populates="order", cascade="all, delete-orphan"
+        back_populates="order", cascade="all, delete-orphan", lazy="selectin"
     )
 
 
@@ -59,13 +102,52 @@ class OrderItemModel(Base):
     order: Mapped[OrderModel] = relationship(back_populates="items")
 
 
+PRODUCT_SORT_COLUMNS = {
+    "id": ProductModel.id,
+    "name": ProductModel.name,
+    "category": ProductModel.category,
+    "price": ProductModel.price,
+    "stock": ProductModel.stock,
+}
+ORDER_SORT_COLUMNS = {
+    "id": OrderModel.id,
+    "customer_name": OrderModel.customer_name,
+    "status": OrderModel.status,
+    "total_amount": OrderModel.total_amount,
+}
+
+
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+def to_async_url(database_url: str) -> URL:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend in ASYNC_DRIVERS and url.get_driver_name() != ASYNC_DRIVERS[backend]:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url
+
+
 def build_engine(database_url: str):
-    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
-    return create_engine(database_url, pool_pre_ping=True, connect_args=connect_args)
+    url = to_async_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        # SQLite has no server-side connection limit; an in-memory database must
+        # share a single connection or every checkout would see an empty schema.
+        pool_options = {"poolclass": StaticPool} if url.database in (None, "", ":memory:") else {}
+        return create_async_engine(url, query_cache_size=DB_QUERY_CACHE_SIZE, **pool_options)
+    return create_async_engine(
+        url,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
 
 
 engine = build_engine(DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
 class ProductBase(BaseModel):
@@ -121,11 +203,13 @@ class Order(BaseModel):
     total_amount: float
 
 
+ORDER_LIST_ADAPTER = TypeAdapter(list[Order])
+
+
 def read_json(path: Path) -> list[dict]:
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8") as file:
-        data = json.load(file)
+    data = orjson.loads(path.read_bytes())
     return data if isinstance(data, list) else []
 
 
@@ -135,7 +219,9 @@ def ensure_mysql_database_exists() -> None:
         return
 
     db_name = url.database
-    admin_url = url.set(database="mysql").render_as_string(hide_password=False)
+    admin_url = url.set(drivername="mysql+pymysql", database="mysql").render_as_string(
+        hide_password=False
+    )
     admin_engine = create_engine(admin_url, pool_pre_ping=True)
     try:
         with admin_engine.begin() as connection:
@@ -149,43 +235,251 @@ def ensure_mysql_database_exists() -> None:
         admin_engine.dispose()
 
 
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    async with SessionLocal() as db:
         yield db
+
+
+class RedisCache:
+    """Redis response cache and startup lock; both stand down when REDIS_URL is unset."""
+
+    def __init__(self, url: str | None, max_connections: int = 20) -> None:
+        self.url = url
+        self.max_connections = max_connections
+        self.pool: redis.ConnectionPool | None = None
+        self.client: redis.Redis | None = None
+
+    async def connect(self) -> None:
+        if not self.url:
+            return
+        self.pool = redis.ConnectionPool.from_url(self.url, max_connections=self.max_connections)
+        self.client = redis.Redis(connection_pool=self.pool)
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            await self.pool.disconnect()
+        self.client = None
+        self.pool = None
+
+    async def get(self, key: str) -> bytes | None:
+        if self.client is None:
+            return None
+        try:
+            return await self.client.get(key)
+        except redis.RedisError:
+            return None
+
+    async def set(self, key: str, value: bytes, expire: int) -> None:
+        if self.client is None:
+            return
+        try:
+            await self.client.set(key, value, ex=expire)
+        except redis.RedisError:
+            pass
+
+    @asynccontextmanager
+    async def lock(self, key: str, expire: int) -> AsyncIterator[None]:
+        """Hold ``key`` for the block, waiting while another process owns it."""
+        token = secrets.token_hex(16).encode()
+        while not await self._set_if_absent(key, token, expire):
+            await asyncio.sleep(0.1)
+        try:
+            yield
+        finally:
+            await self._delete_if_owner(key, token)
+
+    async def _set_if_absent(self, key: str, token: bytes, expire: int) -> bool:
+        # Without Redis there is nothing to coordinate with, so the caller proceeds.
+        if self.client is None:
+            return True
+        try:
+            return bool(await self.client.set(key, token, nx=True, ex=expire))
+        except redis.RedisError:
+            return True
+
+    async def _delete_if_owner(self, key: str, token: bytes) -> None:
+        # Once our lock expires another process may hold the key; only delete our own token.
+        if self.client is None:
+            return
+        try:
+            async with self.client.pipeline() as pipe:
+                await pipe.watch(key)
+                if await pipe.get(key) != token:
+                    await pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                await pipe.execute()
+        except redis.RedisError:
+            pass
+
+    async def delete_pattern(self, pattern: str) -> None:
+        if self.client is None:
+            return
+        try:
+            keys = [key async for key in self.client.scan_iter(match=pattern)]
+            if keys:
+                await self.client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+cache = RedisCache(REDIS_URL)
+
+
+def cached_body(
+    prefix: str, expire: int, model: Any
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[bytes]]]:
+    """Cache a loader's result as JSON bytes under ``prefix``, keyed by its arguments."""
+    adapter = TypeAdapter(model)
+
+    def decorator(loader: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[bytes]]:
+        @wraps(loader)
+        async def wrapper(**kwargs: Any) -> bytes:
+            params = {name: value for name, value in kwargs.items() if name != "db"}
+            digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+            key = f"{prefix}:{loader.__name__}:{digest}"
+            hit = await cache.get(key)
+            if hit is not None:
+                return hit
+            result = await loader(**kwargs)
+            body = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+            # Cache-aside race: a read that queried before a concurrent write committed can
+            # still store its stale body after that write's delete_pattern() has run; it is
+            # then served until it expires, so keep ``expire`` short.
+            await cache.set(key, body, expire)
+            return body
+
+        return wrapper
+
+    return decorator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await cache.connect()
+    # Workers sharing a database create the schema and seed it one at a time, so none of
+    # them races another's CREATE TABLE or seed INSERTs.
+    async with cache.lock(SETUP_LOCK_KEY, expire=60):
+        ensure_mysql_database_exists()
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with SessionLocal() as db:
+            await seed_initial_data(db)
+    try:
+        yield
     finally:
-        db.close()
+        await cache.close()
 
 
-app = FastAPI(title="Product Order API", version="1.1.0", openapi_version="3.0.3")
+# No ORJSONResponse default: with a response_model set, FastAPI already renders JSON bytes via
+# pydantic-core, and ORJSONResponse (deprecated) would route through jsonable_encoder instead.
+app = FastAPI(
+    title="Product Order API", version="1.1.0", openapi_version="3.0.3", lifespan=lifespan
+)
 
 
 def decimal_to_float(value: Decimal) -> float:
     return float(value.quantize(Decimal("0.01")))
 
 
-def get_product_or_404(db: Session, product_id: int) -> ProductModel:
-    product = db.get(ProductModel, product_id)
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/"x" and "x" are the same validator.
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def conditional_json_response(request: Request, body: bytes) -> Response:
+    # A weak ETag over the body also changes when only an order's items change.
+    headers = {"ETag": f'W/"{hashlib.sha1(body).hexdigest()}"', "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+CONDITIONAL_GET_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "headers": {
+            "ETag": {"description": "Weak validator for If-None-Match", "schema": {"type": "string"}},
+            "Cache-Control": {"description": CACHE_CONTROL, "schema": {"type": "string"}},
+        }
+    },
+    304: {"description": "Not Modified: the If-None-Match ETag still matches"},
+}
+
+
+async def get_product_or_404(db: AsyncSession, product_id: int) -> ProductModel:
+    product = await db.get(ProductModel, product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
 
 
-def get_order_or_404(db: Session, order_id: int) -> OrderModel:
-    order = db.get(OrderModel, order_id)
+async def get_order_or_404(db: AsyncSession, order_id: int, with_items: bool = True) -> OrderModel:
+    items_loader = selectinload(OrderModel.items) if with_items else raiseload(OrderModel.items)
+    order = (
+        await db.execute(select(OrderModel).options(items_loader).where(OrderModel.id == order_id))
+    ).scalar_one_or_none()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
 
 
-def calculate_total(db: Session, items: list[OrderItem]) -> Decimal:
-    total = Decimal("0.00")
+async def calculate_total(db: AsyncSession, items: list[OrderItem]) -> Decimal:
+    product_ids = {item.product_id for item in items}
+    price_cents = cast(func.round(ProductModel.price * 100), Integer)
+    prices = dict(
+        (
+            await db.execute(
+                select(ProductModel.id, price_cents).where(ProductModel.id.in_(product_ids))
+            )
+        ).all()
+    )
+    total_cents = 0
     for item in items:
-        product = db.get(ProductModel, item.product_id)
-        if not product:
+        price = prices.get(item.product_id)
+        if price is None:
             raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
-        total += Decimal(product.price) * item.quantity
-    return total.quantize(Decimal("0.01"))
+        total_cents += price * item.quantity
+    return Decimal(total_cents).scaleb(-2)
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    id_column: InstrumentedAttribute[int],
+    sort_column: InstrumentedAttribute[Any],
+    sort_order: str,
+    page: int,
+    page_size: int,
+    after_id: int | None,
+) -> Select:
+    descending = sort_order == "desc"
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    if after_id is None:
+        return query.offset((page - 1) * page_size).limit(page_size)
+
+    # Keyset pagination: seek past the last row the client saw instead of making the
+    # database scan and discard OFFSET rows. Sorting by id needs only the id itself, so
+    # it keeps working after that row is deleted.
+    if sort_column is id_column:
+        seek = id_column < after_id if descending else id_column > after_id
+        return query.where(seek).limit(page_size)
+
+    after_value = await db.scalar(select(sort_column).where(id_column == after_id))
+    if after_value is None:
+        raise HTTPException(status_code=404, detail=f"Row {after_id} for after_id not found")
+    position = tuple_(sort_column, id_column)
+    anchor = tuple_(after_value, after_id)
+    return query.where(position < anchor if descending else position > anchor).limit(page_size)
 
 
 def order_to_response(order: OrderModel) -> Order:
@@ -198,86 +492,150 @@ def order_to_response(order: OrderModel) -> Order:
     )
 
 
-def seed_initial_data(db: Session) -> None:
-    has_product = db.execute(select(ProductModel.id).limit(1)).scalar_one_or_none()
-    if has_product:
+def database_digest(database_url: str) -> str:
+    url = make_url(database_url)
+    return hashlib.sha1(url.render_as_string(hide_password=True).encode()).hexdigest()[:12]
+
+
+def seed_marker_path(database_url: str) -> Path | None:
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return None
+    return DATA_DIR / f".seeded-{database_digest(database_url)}"
+
+
+def mark_seeded() -> None:
+    if SEED_MARKER is None:
         return
+    try:
+        SEED_MARKER.touch()
+    except OSError:
+        pass
 
-    for item in read_json(PRODUCTS_FILE):
-        db.add(
-            ProductModel(
-                id=item.get("id"),
-                name=item["name"],
-                category=item["category"],
-                price=Decimal(str(item["price"])),
-                stock=item["stock"],
-            )
-        )
-    db.commit()
-
-    for item in read_json(ORDERS_FILE):
-        order = OrderModel(
-            id=item.get("id"),
-            customer_name=item["customer_name"],
-            status=item.get("status", "pending"),
-            total_amount=Decimal(str(item.get("total_amount", 0))),
-        )
-        for order_item in item.get("items", []):
-            order.items.append(
-                OrderItemModel(
-                    product_id=order_item["product_id"],
-                    quantity=order_item["quantity"],
-                )
-            )
-        db.add(order)
-    db.commit()
 
+SEED_MARKER = seed_marker_path(DATABASE_URL)
+SETUP_LOCK_KEY = f"setup-lock:{database_digest(DATABASE_URL)}"
 
-@app.on_event("startup")
-def startup() -> None:
-    ensure_mysql_database_exists()
-    Base.metadata.create_all(bind=engine)
-    with SessionLocal() as db:
-        seed_initial_data(db)
+
+async def seed_initial_data(db: AsyncSession) -> None:
+    # Workers sharing a database skip the probe query once any of them has seeded it.
+    if SEED_MARKER is not None and SEED_MARKER.exists():
+        return
+    has_product = (await db.execute(select(ProductModel.id).limit(1))).scalar_one_or_none()
+    if has_product:
+        mark_seeded()
+        return
+
+    products = [
+        {
+            "id": item.get("id"),
+            "name": item["name"],
+            "category": item["category"],
+            "price": Decimal(str(item["price"])),
+            "stock": item["stock"],
+        }
+        for item in read_json(PRODUCTS_FILE)
+    ]
+    if products:
+        await db.execute(insert(ProductModel), products)
+
+    # Order items reference their parent by the id given in the seed file.
+    orders_data = read_json(ORDERS_FILE)
+    orders = [
+        {
+            "id": item["id"],
+            "customer_name": item["customer_name"],
+            "status": item.get("status", "pending"),
+            "total_amount": Decimal(str(item.get("total_amount", 0))),
+        }
+        for item in orders_data
+    ]
+    order_items = [
+        {
+            "order_id": item["id"],
+            "product_id": order_item["product_id"],
+            "quantity": order_item["quantity"],
+        }
+        for item in orders_data
+        for order_item in item.get("items", [])
+    ]
+    if orders:
+        await db.execute(insert(OrderModel), orders)
+    if order_items:
+        await db.execute(insert(OrderItemModel), order_items)
+    await db.commit()
+    mark_seeded()
 
 
 @app.get("/")
-def read_root() -> dict[str, str]:
+async def read_root() -> dict[str, str]:
     return {"message": "Product Order API is running with MySQL"}
 
 
+@cached_body(prefix="products", expire=60, model=list[Product])
+async def load_product_page(
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    after_id: int | None,
+    db: AsyncSession,
+) -> list[RowMapping]:
+    query = select(
+        ProductModel.id,
+        ProductModel.name,
+        ProductModel.category,
+        ProductModel.price,
+        ProductModel.stock,
+    )
+    query = await paginate(
+        db,
+        query,
+        ProductModel.id,
+        PRODUCT_SORT_COLUMNS[sort_by],
+        sort_order,
+        page,
+        page_size,
+        after_id,
+    )
+    return (await db.execute(query)).mappings().all()
+
+
+@cached_body(prefix="products", expire=60, model=Product)
+async def load_product(product_id: int, db: AsyncSession) -> ProductModel:
+    return await get_product_or_404(db, product_id)
+
+
 @app.get("/products", response_model=list[Product])
-def list_products(
+async def list_products(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     sort_by: Literal["id", "name", "category", "price", "stock"] = Query(default="id"),
     sort_order: Literal["asc", "desc"] = Query(default="asc"),
-    db: Session = Depends(get_db),
-) -> list[ProductModel]:
-    sort_column_map = {
-        "id": ProductModel.id,
-        "name": ProductModel.name,
-        "category": ProductModel.category,
-        "price": ProductModel.price,
-        "stock": ProductModel.stock,
-    }
-    sort_column = sort_column_map[sort_by]
-    order_clause = sort_column.desc() if sort_order == "desc" else sort_column.asc()
-    offset = (page - 1) * page_size
-    return (
-        db.execute(select(ProductModel).order_by(order_clause).offset(offset).limit(page_size))
-        .scalars()
-        .all()
+    after_id: int | None = Query(default=None, ge=1),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    # The body is already serialized by the cache layer; skip response_model re-validation.
+    body = await load_product_page(
+        page=page,
+        page_size=page_size,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        after_id=after_id,
+        db=db,
     )
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/products/{product_id}", response_model=Product)
-def get_product(product_id: int, db: Session = Depends(get_db)) -> ProductModel:
-    return get_product_or_404(db, product_id)
+@app.get("/products/{product_id}", response_model=Product, responses=CONDITIONAL_GET_RESPONSES)
+async def get_product(
+    product_id: int, request: Request, db: AsyncSession = Depends(get_db)
+) -> Response:
+    body = await load_product(product_id=product_id, db=db)
+    return conditional_json_response(request, body)
 
 
 @app.post("/products", response_model=Product, status_code=201)
-def create_product(payload: ProductCreate, db: Session = Depends(get_db)) -> ProductModel:
+async def create_product(payload: ProductCreate, db: AsyncSession = Depends(get_db)) -> ProductModel:
     product = ProductModel(
         name=payload.name,
         category=payload.category,
@@ -285,93 +643,140 @@ def create_product(payload: ProductCreate, db: Session = Depends(get_db)) -> Pro
         stock=payload.stock,
     )
     db.add(product)
-    db.commit()
-    db.refresh(product)
+    await db.commit()
+    await db.refresh(product)
+    await cache.delete_pattern("products:*")
     return product
 
 
 @app.put("/products/{product_id}", response_model=Product)
-def update_product(product_id: int, payload: ProductUpdate, db: Session = Depends(get_db)) -> ProductModel:
-    product = get_product_or_404(db, product_id)
+async def update_product(
+    product_id: int, payload: ProductUpdate, db: AsyncSession = Depends(get_db)
+) -> ProductModel:
+    product = await get_product_or_404(db, product_id)
     updates = payload.model_dump(exclude_unset=True)
     if "price" in updates:
         updates["price"] = Decimal(str(updates["price"])).quantize(Decimal("0.01"))
     for field, value in updates.items():
         setattr(product, field, value)
-    db.commit()
-    db.refresh(product)
+    await db.commit()
+    await db.refresh(product)
+    await cache.delete_pattern("products:*")
     return product
 
 
 @app.delete("/products/{product_id}", status_code=204)
-def delete_product(product_id: int, db: Session = Depends(get_db)) -> None:
-    product = get_product_or_404(db, product_id)
-    referenced = db.execute(
-        select(OrderItemModel.id).where(OrderItemModel.product_id == product_id).limit(1)
+async def delete_product(product_id: int, db: AsyncSession = Depends(get_db)) -> None:
+    product = await get_product_or_404(db, product_id)
+    referenced = (
+        await db.execute(
+            select(OrderItemModel.id).where(OrderItemModel.product_id == product_id).limit(1)
+        )
     ).scalar_one_or_none()
     if referenced:
         raise HTTPException(status_code=409, detail="Product is referenced by existing orders")
-    db.delete(product)
-    db.commit()
+    await db.delete(product)
+    await db.commit()
+    await cache.delete_pattern("products:*")
 
 
 @app.get("/orders", response_model=list[Order])
-def list_orders(
+async def list_orders(
     customer_name: str | None = Query(default=None),
     status: str | None = Query(default=None),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     sort_by: Literal["id", "customer_name", "status", "total_amount"] = Query(default="id"),
     sort_order: Literal["asc", "desc"] = Query(default="asc"),
-    db: Session = Depends(get_db),
-) -> list[Order]:
-    sort_column_map = {
-        "id": OrderModel.id,
-        "customer_name": OrderModel.customer_name,
-        "status": OrderModel.status,
-        "total_amount": OrderModel.total_amount,
-    }
-    sort_column = sort_column_map[sort_by]
-    order_clause = sort_column.desc() if sort_order == "desc" else sort_column.asc()
-
-    query = select(OrderModel).order_by(order_clause)
+    after_id: int | None = Query(default=None, ge=1),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    query = select(
+        OrderModel.id, OrderModel.customer_name, OrderModel.status, OrderModel.total_amount
+    )
     if customer_name:
         query = query.where(OrderModel.customer_name.ilike(f"%{customer_name}%"))
     if status:
         query = query.where(OrderModel.status == status)
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
-    orders = db.execute(query).scalars().all()
-    return [order_to_response(order) for order in orders]
+    # Paginate the order headers first so LIMIT counts orders rather than joined item rows.
+    page_query = (
+        await paginate(
+            db,
+            query,
+            OrderModel.id,
+            ORDER_SORT_COLUMNS[sort_by],
+            sort_order,
+            page,
+            page_size,
+            after_id,
+        )
+    ).subquery()
+    page_sort_column = page_query.c[sort_by]
+    page_order_clauses = (
+        (page_sort_column.desc(), page_query.c.id.desc())
+        if sort_order == "desc"
+        else (page_sort_column.asc(), page_query.c.id.asc())
+    )
+    rows = await db.execute(
+        select(page_query, OrderItemModel.product_id, OrderItemModel.quantity)
+        .outerjoin(OrderItemModel, OrderItemModel.order_id == page_query.c.id)
+        .order_by(*page_order_clauses, OrderItemModel.id)
+    )
 
+    # Rows come straight from typed columns, so build the models without re-running validators.
+    orders: dict[int, Order] = {}
+    for row in rows.mappings():
+        order = orders.get(row["id"])
+        if order is None:
+            order = orders[row["id"]] = Order.model_construct(
+                id=row["id"],
+                customer_name=row["customer_name"],
+                status=row["status"],
+                items=[],
+                total_amount=decimal_to_float(row["total_amount"]),
+            )
+        if row["product_id"] is not None:
+            order.items.append(
+                OrderItem.model_construct(product_id=row["product_id"], quantity=row["quantity"])
+            )
+    return Response(
+        content=ORDER_LIST_ADAPTER.dump_json(list(orders.values())), media_type="application/json"
+    )
 
-@app.get("/orders/{order_id}", response_model=Order)
-def get_order(order_id: int, db: Session = Depends(get_db)) -> Order:
-    return order_to_response(get_order_or_404(db, order_id))
+
+@app.get("/orders/{order_id}", response_model=Order, responses=CONDITIONAL_GET_RESPONSES)
+async def get_order(order_id: int, request: Request, db: AsyncSession = Depends(get_db)) -> Response:
+    order = order_to_response(await get_order_or_404(db, order_id))
+    return conditional_json_response(request, order.model_dump_json().encode())
 
 
 @app.post("/orders", response_model=Order, status_code=201)
-def create_order(payload: OrderCreate, db: Session = Depends(get_db)) -> Order:
-    total = calculate_total(db, payload.items)
+async def create_order(payload: OrderCreate, db: AsyncSession = Depends(get_db)) -> Order:
+    total = await calculate_total(db, payload.items)
     order = OrderModel(
         customer_name=payload.customer_name,
         status=payload.status,
         total_amount=total,
-        items=[
-            OrderItemModel(product_id=item.product_id, quantity=item.quantity)
+    )
+    db.add(order)
+    await db.flush()
+    await db.execute(
+        insert(OrderItemModel),
+        [
+            {"order_id": order.id, "product_id": item.product_id, "quantity": item.quantity}
             for item in payload.items
         ],
     )
-    db.add(order)
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order, ["items"])
     return order_to_response(order)
 
 
 @app.put("/orders/{order_id}", response_model=Order)
-def update_order(order_id: int, payload: OrderUpdate, db: Session = Depends(get_db)) -> Order:
-    order = get_order_or_404(db, order_id)
+async def update_order(order_id: int, payload: OrderUpdate, db: AsyncSession = Depends(get_db)) -> Order:
     updates = payload.model_dump(exclude_unset=True)
+    # Items that are about to be replaced don't need loading.
+    order = await get_order_or_404(db, order_id, with_items="items" not in updates)
 
     if "customer_name" in updates:
         order.customer_name = updates["customer_name"]
@@ -382,19 +787,24 @@ def update_order(order_id: int, payload: OrderUpdate, db: Session = Depends(get_
         new_items = [
             OrderItem(**item) if isinstance(item, dict) else item for item in updates["items"]
         ]
-        order.total_amount = calculate_total(db, new_items)
-        order.items.clear()
-        order.items.extend(
-            [OrderItemModel(product_id=item.product_id, quantity=item.quantity) for item in new_items]
+        order.total_amount = await calculate_total(db, new_items)
+        await db.execute(delete(OrderItemModel).where(OrderItemModel.order_id == order.id))
+        await db.execute(
+            insert(OrderItemModel),
+            [
+                {"order_id": order.id, "product_id": item.product_id, "quantity": item.quantity}
+                for item in new_items
+            ],
         )
 
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    if "items" in updates:
+        await db.refresh(order, ["items"])
     return order_to_response(order)
 
 
 @app.delete("/orders/{order_id}", status_code=204)
-def delete_order(order_id: int, db: Session = Depends(get_db)) -> None:
-    order = get_order_or_404(db, order_id)
-    db.delete(order)
-    db.commit()
+async def delete_order(order_id: int, db: AsyncSession = Depends(get_db)) -> None:
+    order = await get_order_or_404(db, order_id)
+    await db.delete(order)
+    await db.commit()
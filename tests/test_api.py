@@ -1,5 +1,7 @@
+import fakeredis
 from fastapi.testclient import TestClient
 
+import main
 from main import app
 
 
@@ -37,3 +39,154 @@ def test_create_and_get_order():
     assert fetched["customer_name"] == "Taylor Green"
     assert fetched["status"] == "processing"
 
+
+def test_create_order_with_unknown_product_returns_404():
+    payload = {
+        "customer_name": "Jordan Lee",
+        "items": [
+            {"product_id": 1, "quantity": 1},
+            {"product_id": 999999, "quantity": 1},
+        ],
+    }
+
+    response = client.post("/orders", json=payload)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Product 999999 not found"
+
+
+def test_list_orders_includes_items():
+    response = client.get("/orders", params={"page": 1, "page_size": 5})
+    assert response.status_code == 200
+    data = response.json()
+    assert data
+    assert all(order["items"] for order in data)
+
+
+def test_list_orders_page_size_counts_orders_not_items():
+    payload = {
+        "customer_name": "Morgan Fields",
+        "items": [
+            {"product_id": 1, "quantity": 1},
+            {"product_id": 2, "quantity": 1},
+            {"product_id": 3, "quantity": 1},
+        ],
+    }
+    created = client.post("/orders", json=payload).json()
+
+    response = client.get(
+        "/orders", params={"customer_name": "Morgan Fields", "page_size": 1, "sort_order": "desc"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["id"] == created["id"]
+    assert data[0]["items"] == payload["items"]
+
+
+def test_update_order_replaces_items():
+    payload = {
+        "customer_name": "Casey Reed",
+        "items": [
+            {"product_id": 1, "quantity": 1},
+            {"product_id": 2, "quantity": 1},
+        ],
+    }
+    order_id = client.post("/orders", json=payload).json()["id"]
+
+    new_items = [{"product_id": 3, "quantity": 2}]
+    update_response = client.put(f"/orders/{order_id}", json={"items": new_items})
+    assert update_response.status_code == 200
+    assert update_response.json()["items"] == new_items
+
+    fetched = client.get(f"/orders/{order_id}").json()
+    assert fetched["items"] == new_items
+    assert fetched["total_amount"] == update_response.json()["total_amount"]
+
+
+def test_order_total_is_exact_to_the_cent():
+    prices = {p["id"]: p["price"] for p in client.get("/products", params={"page_size": 100}).json()}
+    items = [{"product_id": 2, "quantity": 3}, {"product_id": 3, "quantity": 7}]
+    payload = {"customer_name": "Riley Hart", "items": items}
+
+    response = client.post("/orders", json=payload)
+    assert response.status_code == 201
+    expected_cents = sum(round(prices[i["product_id"]] * 100) * i["quantity"] for i in items)
+    assert round(response.json()["total_amount"] * 100) == expected_cents
+
+
+def test_list_products_after_id_continues_from_last_item():
+    params = {"page_size": 2, "sort_by": "price", "sort_order": "desc"}
+    first_page = client.get("/products", params={**params, "page": 1}).json()
+    second_page = client.get("/products", params={**params, "page": 2}).json()
+
+    response = client.get("/products", params={**params, "after_id": first_page[-1]["id"]})
+    assert response.status_code == 200
+    assert response.json() == second_page
+
+
+def test_get_product_revalidates_with_etag():
+    response = client.get("/products/1")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "max-age=30, stale-while-revalidate=60"
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    not_modified = client.get("/products/1", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+def test_list_orders_customer_name_matches_substring():
+    payload = {"customer_name": "Quinn Taylorson", "items": [{"product_id": 1, "quantity": 1}]}
+    created = client.post("/orders", json=payload).json()
+
+    response = client.get(
+        "/orders", params={"customer_name": "aylors", "page_size": 1, "sort_order": "desc"}
+    )
+    assert response.status_code == 200
+    assert [order["id"] for order in response.json()] == [created["id"]]
+
+
+def test_list_products_after_id_survives_deleted_anchor():
+    payload = {"name": "Cable Tie", "category": "Accessories", "price": 1.25, "stock": 10}
+    product_id = client.post("/products", json=payload).json()["id"]
+    assert client.delete(f"/products/{product_id}").status_code == 204
+
+    response = client.get(
+        "/products", params={"after_id": product_id, "sort_order": "desc", "page_size": 2}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data
+    assert all(product["id"] < product_id for product in data)
+
+
+def test_list_orders_after_id_with_unknown_anchor_for_other_sort_returns_404():
+    response = client.get("/orders", params={"after_id": 999999, "sort_by": "total_amount"})
+    assert response.status_code == 404
+
+
+def test_get_order_if_none_match_uses_weak_comparison():
+    response = client.get("/orders/1")
+    assert response.status_code == 200
+    strong_form = response.headers["etag"].removeprefix("W/")
+
+    not_modified = client.get("/orders/1", headers={"If-None-Match": f'"other", {strong_form}'})
+    assert not_modified.status_code == 304
+
+
+def test_product_cache_is_invalidated_by_update():
+    main.cache.client = fakeredis.FakeAsyncRedis()
+    try:
+        original = client.get("/products/1").json()
+        client.get("/products", params={"page_size": 100})
+        new_stock = original["stock"] + 1
+
+        assert client.put("/products/1", json={"stock": new_stock}).status_code == 200
+
+        assert client.get("/products/1").json()["stock"] == new_stock
+        listed = client.get("/products", params={"page_size": 100}).json()
+        assert next(p for p in listed if p["id"] == 1)["stock"] == new_stock
+    finally:
+        main.cache.client = None